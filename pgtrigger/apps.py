@@ -2,12 +2,13 @@ import django.apps
 import django.db.backends.postgresql.schema as postgresql_schema
 from django.conf import settings
 from django.core.management.commands import makemigrations, migrate
+from django.core.signals import setting_changed
 from django.db.migrations import state
 from django.db.models import options
 from django.db.models.signals import post_migrate
 from django.db.utils import load_backend
 
-from pgtrigger import core, features, installation, migrations
+from pgtrigger import core, features, installation, migrations, utils
 
 # Allow triggers to be specified in model Meta. Users can turn this
 # off via settings if it causes issues. If turned off, migrations
@@ -105,3 +106,6 @@ class PGTriggerConfig(django.apps.AppConfig):
 
         # Configure triggers to automatically be installed after migrations
         post_migrate.connect(install_on_migrate, sender=self)
+
+        # Cached database lookups are reset when database settings are overridden
+        setting_changed.connect(utils.clear_database_caches)
@@ -896,8 +896,9 @@ class Trigger:
         Returns:
             A psycopg cursor result
         """
+        # allow_migrate only passes for Postgres databases
         if self.allow_migrate(model, database=database):
-            return utils.exec_sql(str(sql), database=database, fetchall=fetchall)
+            return utils.exec_postgres_sql(str(sql), database=database, fetchall=fetchall)
 
     def get_installation_status(
         self, model: models.Model, database: Union[str, None] = None
@@ -5,7 +5,7 @@ The primary functional API for pgtrigger
 import logging
 from typing import List, Tuple, Union
 
-from django.db import DEFAULT_DB_ALIAS, connections
+from django.db import DEFAULT_DB_ALIAS
 
 from pgtrigger import features, registry, utils
 
@@ -85,18 +85,21 @@ def prune(database: Union[str, None] = None) -> None:
     Args:
         database: The database. Defaults to the "default" database.
     """
-    for trigger in prunable(database=database):
-        LOGGER.info(
-            "pgtrigger: Pruning trigger %s for table %s on %s database.",
-            trigger[1],
-            trigger[0],
-            trigger[3],
-        )
+    triggers = prunable(database=database)
+    if not triggers:
+        return
 
-        connection = connections[trigger[3]]
-        uninstall_sql = utils.render_uninstall(trigger[0], trigger[1])
-        with connection.cursor() as cursor:
-            cursor.execute(uninstall_sql)
+    # All prunable triggers come from the same database, so share one cursor
+    with utils.connection(database).cursor() as cursor:
+        for trigger in triggers:
+            LOGGER.info(
+                "pgtrigger: Pruning trigger %s for table %s on %s database.",
+                trigger[1],
+                trigger[0],
+                trigger[3],
+            )
+
+            cursor.execute(utils.render_uninstall(trigger[0], trigger[1]))
 
 
 def enable(*uris: str, database: Union[str, None] = None) -> None:
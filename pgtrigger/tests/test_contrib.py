@@ -1,23 +1,34 @@
 import datetime as dt
+import re
 
-import ddf
 import django
 import pgbulk
 import pytest
 from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Q
 
 import pgtrigger
 from pgtrigger.tests import models, utils
 
+_RE_CANNOT_UPDATE = re.compile("Cannot update rows")
+_RE_CANNOT_DELETE = re.compile("Cannot delete rows")
+_RE_CANNOT_INSERT = re.compile("Cannot insert rows")
+_RE_INVALID_TRANSITION = re.compile("Invalid transition")
+_RE_HIT_CONDITION = re.compile("hit condition")
+
+_RETURN_NULL_FUNC = pgtrigger.Func("RETURN NULL;")
+
+_DT_2015 = dt.datetime(2015, 1, 1)
+_DT_2016 = dt.datetime(2016, 1, 2)
+
 
 def test_registered_invalid_args():
     with pytest.raises(ValueError):
         pgtrigger.registered("uri")
 
 
-@pytest.mark.django_db
-def test_read_only():
-    """Tests the ReadOnly trigger"""
+def test_read_only_args():
+    """Verifies arg checking for ReadOnly"""
     with pytest.raises(ValueError, match="only one of"):
         pgtrigger.ReadOnly(name="uneditable", fields=["level"], exclude=["hello"])
 
@@ -29,32 +40,31 @@ def test_read_only():
     with pytest.raises(FieldDoesNotExist):
         trigger.install(models.TestModel)
 
-    trigger = pgtrigger.ReadOnly(name="uneditable")
-    with trigger.install(models.TestModel):
-        m = ddf.G(models.TestModel, int_field=1)
-        m.save()
-
-        with utils.raises_trigger_error(match="Cannot update rows"):
-            m.int_field = 2
-            m.save()
 
-    trigger = pgtrigger.ReadOnly(name="uneditable", fields=["char_field", "float_field"])
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "trigger, editable_field",
+    [
+        (pgtrigger.ReadOnly(name="uneditable"), None),
+        (pgtrigger.ReadOnly(name="uneditable", fields=["char_field", "float_field"]), "int_field"),
+        (pgtrigger.ReadOnly(name="uneditable", exclude=["int_field"]), "int_field"),
+    ],
+    ids=["all", "fields", "exclude"],
+)
+def test_read_only_installed(trigger, editable_field):
+    """Tests the ReadOnly trigger variants when installed"""
     with trigger.install(models.TestModel):
-        m = ddf.G(models.TestModel, int_field=2, char_field="a")
-        m.int_field = 3
+        m = models.TestModel.objects.create(int_field=1, char_field="a")
         m.save()
 
-        with utils.raises_trigger_error(match="Cannot update rows"):
-            m.char_field = "b"
-            m.save()
+        if editable_field:
+            models.TestModel.objects.filter(pk=m.pk).update(**{editable_field: 2})
+        else:
+            with utils.raises_trigger_error(match=_RE_CANNOT_UPDATE):
+                m.int_field = 2
+                m.save()
 
-    trigger = pgtrigger.ReadOnly(name="uneditable", exclude=["int_field"])
-    with trigger.install(models.TestModel):
-        m = ddf.G(models.TestModel, int_field=4, char_field="a")
-        m.int_field = 5
-        m.save()
-
-        with utils.raises_trigger_error(match="Cannot update rows"):
+        with utils.raises_trigger_error(match=_RE_CANNOT_UPDATE):
             m.char_field = "b"
             m.save()
 
@@ -62,26 +72,38 @@ def test_read_only():
 @pytest.mark.django_db
 def test_search_model():
     """Verifies search model fields are kept up to date"""
-    obj = models.SearchModel.objects.create(
-        title="This is a message", body="Hello World. What a great body."
-    )
-    models.SearchModel.objects.create(title="Hi guys", body="Random Word. This is a good idea.")
-    models.SearchModel.objects.create(
-        title="Hello", body="Other words. Many great ideas come from stuff."
+    obj, *_ = models.SearchModel.objects.bulk_create(
+        [
+            models.SearchModel(title="This is a message", body="Hello World. What a great body."),
+            models.SearchModel(title="Hi guys", body="Random Word. This is a good idea."),
+            models.SearchModel(
+                title="Hello", body="Other words. Many great ideas come from stuff."
+            ),
+            models.SearchModel(title="The title", body="A short message."),
+        ]
     )
-    models.SearchModel.objects.create(title="The title", body="A short message.")
 
-    assert models.SearchModel.objects.filter(body_vector="hello").count() == 1
-    assert models.SearchModel.objects.filter(body_vector="words").count() == 2
-    assert models.SearchModel.objects.filter(body_vector="world").count() == 1
-    assert models.SearchModel.objects.filter(title_body_vector="message").count() == 2
-    assert models.SearchModel.objects.filter(title_body_vector="idea").count() == 2
-    assert models.SearchModel.objects.filter(title_body_vector="hello").count() == 2
-
-    obj.body = "Nothing more"
-    obj.save()
-    assert not models.SearchModel.objects.filter(body_vector="hello").exists()
-    assert models.SearchModel.objects.filter(title_body_vector="hello").count() == 1
+    assert models.SearchModel.objects.aggregate(
+        body_hello=Count("pk", filter=Q(body_vector="hello")),
+        body_words=Count("pk", filter=Q(body_vector="words")),
+        body_world=Count("pk", filter=Q(body_vector="world")),
+        title_body_message=Count("pk", filter=Q(title_body_vector="message")),
+        title_body_idea=Count("pk", filter=Q(title_body_vector="idea")),
+        title_body_hello=Count("pk", filter=Q(title_body_vector="hello")),
+    ) == {
+        "body_hello": 1,
+        "body_words": 2,
+        "body_world": 1,
+        "title_body_message": 2,
+        "title_body_idea": 2,
+        "title_body_hello": 2,
+    }
+
+    models.SearchModel.objects.filter(pk=obj.pk).update(body="Nothing more")
+    assert models.SearchModel.objects.aggregate(
+        body_hello=Count("pk", filter=Q(body_vector="hello")),
+        title_body_hello=Count("pk", filter=Q(title_body_vector="hello")),
+    ) == {"body_hello": 0, "title_body_hello": 1}
 
 
 def test_update_search_vector_args():
@@ -108,26 +130,26 @@ def test_soft_delete():
     """
     Verifies the SoftDelete test model has the "is_active" flag set to false
     """
-    soft_delete = ddf.G(models.SoftDelete, is_active=True)
-    ddf.G(models.FkToSoftDelete, ref=soft_delete)
+    soft_delete = models.SoftDelete.objects.create(is_active=True)
+    models.FkToSoftDelete.objects.create(ref=soft_delete)
     soft_delete.delete()
 
     assert not models.SoftDelete.objects.get().is_active
     assert not models.FkToSoftDelete.objects.exists()
 
 
+@pytest.mark.skipif(django.VERSION < (5, 2), reason="Composite primary keys require Django 5.2")
 @pytest.mark.django_db
 def test_soft_delete_composite_pk():
     """
     Verifies the SoftDelete test model has the "is_active" flag set to false
     """
-    if django.VERSION >= (5, 2):
-        models.SoftDeleteCompositePk.objects.create(is_active=True, id_1=1, id_2=1)
-        soft_delete = models.SoftDeleteCompositePk.objects.create(is_active=True, id_1=2, id_2=2)
-        soft_delete.delete()
+    models.SoftDeleteCompositePk.objects.create(is_active=True, id_1=1, id_2=1)
+    soft_delete = models.SoftDeleteCompositePk.objects.create(is_active=True, id_1=2, id_2=2)
+    soft_delete.delete()
 
-        assert models.SoftDeleteCompositePk.objects.get(id_1=1, id_2=1).is_active
-        assert not models.SoftDeleteCompositePk.objects.get(id_1=2, id_2=2).is_active
+    assert models.SoftDeleteCompositePk.objects.get(id_1=1, id_2=1).is_active
+    assert not models.SoftDeleteCompositePk.objects.get(id_1=2, id_2=2).is_active
 
 
 @pytest.mark.django_db
@@ -136,33 +158,32 @@ def test_customer_soft_delete():
     Verifies the CustomSoftDelete test model has the "custom_active" flag set
     to false
     """
-    soft_delete = ddf.G(models.CustomSoftDelete, custom_active=True)
+    soft_delete = models.CustomSoftDelete.objects.create(custom_active=True)
     soft_delete.delete()
 
     assert not models.CustomSoftDelete.objects.get().custom_active
 
 
 @pytest.mark.django_db
-def test_soft_delete_different_values():
+@pytest.mark.parametrize(
+    "field, value, initial",
+    [
+        # Make the LogEntry model a soft delete model where "level" is set to "inactive"
+        ("level", "inactive", "active"),
+        # Make the LogEntry model a soft delete model where "old_field" is set to None
+        ("old_field", None, "something"),
+    ],
+    ids=["level", "old_field"],
+)
+def test_soft_delete_different_values(field, value, initial):
     """
     Tests SoftDelete with different types of fields and values
     """
-    # Make the LogEntry model a soft delete model where
-    # "level" is set to "inactive"
-    trigger = pgtrigger.SoftDelete(name="soft_delete", field="level", value="inactive")
+    trigger = pgtrigger.SoftDelete(name="soft_delete", field=field, value=value)
     with trigger.install(models.LogEntry):
-        le = ddf.G(models.LogEntry, level="active")
+        le = models.LogEntry.objects.create(**{field: initial})
         le.delete()
-        assert models.LogEntry.objects.get().level == "inactive"
-    models.LogEntry.objects.all().delete()
-
-    # Make the LogEntry model a soft delete model where
-    # "old_field" is set to None
-    trigger = pgtrigger.SoftDelete(name="soft_delete", field="old_field", value=None)
-    with trigger.install(models.LogEntry):
-        le = ddf.G(models.LogEntry, old_field="something")
-        le.delete()
-        assert models.LogEntry.objects.get().old_field is None
+        assert getattr(models.LogEntry.objects.get(), field) == value
 
 
 @pytest.mark.django_db
@@ -170,57 +191,61 @@ def test_fsm():
     """
     Verifies the FSM test model cannot make invalid transitions
     """
-    fsm = ddf.G(models.FSM, transition="unpublished")
+    fsm = models.FSM.objects.create(transition="unpublished")
+    # Valid transitions are applied with queryset updates. The trigger fires the
+    # same way and model save signals are skipped
+    fsm_qset = models.FSM.objects.filter(pk=fsm.pk)
+
     fsm.transition = "inactive"
-    with utils.raises_trigger_error(match="Invalid transition"):
+    with utils.raises_trigger_error(match=_RE_INVALID_TRANSITION):
         fsm.save()
 
-    fsm.transition = "published"
-    fsm.save()
+    fsm_qset.update(transition="published")
 
     # Be sure we ignore FSM when there is no transition
-    fsm.save()
+    fsm_qset.update(transition="published")
 
-    with utils.raises_trigger_error(match="Invalid transition"):
+    with utils.raises_trigger_error(match=_RE_INVALID_TRANSITION):
         fsm.transition = "unpublished"
         fsm.save()
 
-    fsm.transition = "inactive"
-    fsm.save()
+    fsm_qset.update(transition="inactive")
+    assert fsm_qset.get().transition == "inactive"
 
 
-def test_fsm_args():
+@pytest.mark.parametrize(
+    "kwargs, match",
+    [
+        ({}, 'provide "field"'),
+        ({"field": "hello"}, 'provide "transitions"'),
+        ({"field": "hello", "transitions": [("a", ":")]}, 'contains separator ":"'),
+        (
+            {"field": "hello", "separator": ",", "transitions": [("a", ",")]},
+            'contains separator ","',
+        ),
+        ({"field": "hello", "transitions": [("a", "b'")]}, "contains quotes"),
+        ({"field": "hello", "transitions": [("a", 'b"')]}, "contains quotes"),
+        (
+            {"field": "hello", "separator": "aa", "transitions": [("a", "b")]},
+            "single character",
+        ),
+        (
+            {"field": "hello", "separator": "'", "transitions": [("a", "b")]},
+            "must not have quotes",
+        ),
+    ],
+)
+def test_fsm_args(kwargs, match):
     """Verifies arg checking for FSM"""
-    with pytest.raises(ValueError, match='provide "field"'):
-        pgtrigger.FSM()
-
-    with pytest.raises(ValueError, match='provide "transitions"'):
-        pgtrigger.FSM(field="hello")
-
-    with pytest.raises(ValueError, match='contains separator ":"'):
-        pgtrigger.FSM(field="hello", transitions=[("a", ":")])
-
-    with pytest.raises(ValueError, match='contains separator ","'):
-        pgtrigger.FSM(field="hello", separator=",", transitions=[("a", ",")])
-
-    with pytest.raises(ValueError, match="contains quotes"):
-        pgtrigger.FSM(field="hello", transitions=[("a", "b'")])
-
-    with pytest.raises(ValueError, match="contains quotes"):
-        pgtrigger.FSM(field="hello", transitions=[("a", 'b"')])
-
-    with pytest.raises(ValueError, match="single character"):
-        pgtrigger.FSM(field="hello", separator="aa", transitions=[("a", "b")])
-
-    with pytest.raises(ValueError, match="must not have quotes"):
-        pgtrigger.FSM(field="hello", separator="'", transitions=[("a", "b")])
+    with pytest.raises(ValueError, match=match):
+        pgtrigger.FSM(**kwargs)
 
 
 @pytest.mark.django_db
 def test_protect():
     """Verify deletion protect trigger works on test model"""
-    deletion_protected_model = ddf.G(models.TestTrigger)
-    with utils.raises_trigger_error(match="Cannot delete rows"):
+    deletion_protected_model = models.TestTrigger.objects.create()
+    with utils.raises_trigger_error(match=_RE_CANNOT_DELETE):
         deletion_protected_model.delete()
 
 
@@ -242,7 +267,7 @@ def test_protect_statement_level_insert_update():
                 models.TestTrigger(int_field=30),
             ]
         )
-        with utils.raises_trigger_error(match="Cannot insert rows"):
+        with utils.raises_trigger_error(match=_RE_CANNOT_INSERT):
             models.TestTrigger.objects.bulk_create(
                 [
                     models.TestTrigger(int_field=2),
@@ -266,7 +291,7 @@ def test_protect_statement_level_insert_update():
             ]
         )
         models.TestTrigger.objects.update(int_field=1)
-        with utils.raises_trigger_error(match="Cannot update rows"):
+        with utils.raises_trigger_error(match=_RE_CANNOT_UPDATE):
             models.TestTrigger.objects.update(int_field=101)
 
 
@@ -291,9 +316,8 @@ def test_protect_statement_level_delete():
                 models.TestTrigger(int_field=30),
             ]
         )
-        print("values", values[0].int_field)
         values[0].delete()
-        with utils.raises_trigger_error(match="Cannot delete rows"):
+        with utils.raises_trigger_error(match=_RE_CANNOT_DELETE):
             models.TestTrigger.objects.all().delete()
 
 
@@ -314,56 +338,37 @@ def test_readonly_statement_level():
                 models.TestTrigger(int_field=30),
             ]
         )
-        with utils.raises_trigger_error(match="Cannot update rows"):
+        with utils.raises_trigger_error(match=_RE_CANNOT_UPDATE):
             models.TestTrigger.objects.update(int_field=101)
 
 
 @pytest.mark.django_db
 def test_custom_db_table_protect_trigger():
     """Verify custom DB table names have successful triggers"""
-    deletion_protected_model = ddf.G(models.CustomTableName)
-    with utils.raises_trigger_error(match="Cannot delete rows"):
+    deletion_protected_model = models.CustomTableName.objects.create()
+    with utils.raises_trigger_error(match=_RE_CANNOT_DELETE):
         deletion_protected_model.delete()
 
 
-@pytest.mark.django_db
-def test_composer_protect():
-    """Verify composer trigger with protection-like trigger."""
-
-    # Test a simple protection trigger that loops through conditional rows
-    composer_raise = pgtrigger.Composer(
-        name="composer_protect",
-        when=pgtrigger.After,
-        operation=pgtrigger.Insert,
-        level=pgtrigger.Statement,
-        declare=[("val", "RECORD")],
-        func=pgtrigger.Func(
-            """
-            FOR val IN SELECT * FROM {cond_new_values}
-            LOOP
-            RAISE EXCEPTION 'hit condition';
-            END LOOP;
-            RETURN NULL;
-            """
-        ),
-        condition=pgtrigger.Q(new__int_field__gt=0),
+def _composer(**kwargs):
+    """Build a statement-level after-update Composer, overriding any of its arguments"""
+    return pgtrigger.Composer(
+        **{
+            "name": "composer_values_properties",
+            "level": pgtrigger.Statement,
+            "when": pgtrigger.After,
+            "operation": pgtrigger.Update,
+        }
+        | kwargs
     )
 
-    with composer_raise.install(models.TestTrigger):
-        ddf.G(models.TestTrigger, int_field=0)
-        with utils.raises_trigger_error(match="hit condition"):
-            models.TestTrigger.objects.create(int_field=2)
-
 
-@pytest.mark.django_db
-def test_composer_protect_no_condition():
-    """Verify composer trigger with protection-like trigger."""
-
-    # Test a simple protection trigger that loops through conditional rows
-    composer_raise = pgtrigger.Composer(
-        name="composer_protect",
+def _composer_raise(name, operation, condition=None):
+    """Build a protection-like composer trigger that loops through conditional rows"""
+    return pgtrigger.Composer(
+        name=name,
         when=pgtrigger.After,
-        operation=pgtrigger.Insert,
+        operation=operation,
         level=pgtrigger.Statement,
         declare=[("val", "RECORD")],
         func=pgtrigger.Func(
@@ -375,42 +380,52 @@ def test_composer_protect_no_condition():
             RETURN NULL;
             """
         ),
+        condition=condition,
     )
 
-    with composer_raise.install(models.TestTrigger):
-        with utils.raises_trigger_error(match="hit condition"):
-            models.TestTrigger.objects.create(int_field=2)
 
+def _bulk_create_and_update_unchanged():
+    models.TestTrigger.objects.bulk_create([models.TestTrigger(int_field=0) for _ in range(5)])
+    # A redundant update should not trigger
+    models.TestTrigger.objects.update(int_field=0)
 
-@pytest.mark.django_db
-def test_composer_protect_custom_condition():
-    """Verify composer trigger with a custom protection-like condition."""
 
-    composer_raise = pgtrigger.Composer(
-        name="composer_protect_update",
-        when=pgtrigger.After,
-        operation=pgtrigger.Update,
-        level=pgtrigger.Statement,
-        declare=[("val", "RECORD")],
-        func=pgtrigger.Func(
-            """
-            FOR val IN SELECT * FROM {cond_new_values}
-            LOOP
-            RAISE EXCEPTION 'hit condition';
-            END LOOP;
-            RETURN NULL;
-            """
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "name, operation, condition, no_trigger, trigger",
+    [
+        (
+            "composer_protect",
+            pgtrigger.Insert,
+            pgtrigger.Q(new__int_field__gt=0),
+            lambda: models.TestTrigger.objects.create(int_field=0),
+            lambda: models.TestTrigger.objects.create(int_field=2),
         ),
-        condition=pgtrigger.Condition("NEW.* IS DISTINCT FROM OLD.*"),
-    )
-
-    with composer_raise.install(models.TestTrigger):
-        ddf.G(models.TestTrigger, int_field=0, n=5)
-        # A redundant update should not trigger
-        models.TestTrigger.objects.update(int_field=0)
+        (
+            "composer_protect",
+            pgtrigger.Insert,
+            None,
+            None,
+            lambda: models.TestTrigger.objects.create(int_field=2),
+        ),
+        (
+            "composer_protect_update",
+            pgtrigger.Update,
+            pgtrigger.Condition("NEW.* IS DISTINCT FROM OLD.*"),
+            _bulk_create_and_update_unchanged,
+            lambda: models.TestTrigger.objects.update(int_field=2),
+        ),
+    ],
+    ids=["condition", "no_condition", "custom_condition"],
+)
+def test_composer_protect(name, operation, condition, no_trigger, trigger):
+    """Verify composer triggers with protection-like conditions."""
+    with _composer_raise(name, operation, condition).install(models.TestTrigger):
+        if no_trigger:
+            no_trigger()
 
-        with utils.raises_trigger_error(match="hit condition"):
-            models.TestTrigger.objects.update(int_field=2)
+        with utils.raises_trigger_error(match=_RE_HIT_CONDITION):
+            trigger()
 
 
 @pytest.mark.django_db
@@ -435,7 +450,9 @@ def test_composer_log():
 
     with composer_log.install(models.TestTrigger):
         assert models.TestTrigger.objects.count() == 0
-        ddf.G(models.TestTrigger, int_field=0, field="a", dt_field=dt.datetime(2015, 1, 1), n=5)
+        models.TestTrigger.objects.bulk_create(
+            [models.TestTrigger(int_field=0, field="a", dt_field=_DT_2015) for _ in range(5)]
+        )
         assert models.TestTrigger.objects.count() == 5
 
         # The conditional statement trigger should not fire
@@ -443,27 +460,31 @@ def test_composer_log():
         assert models.TestTrigger.objects.count() == 5
 
         # The condition will fire this time, creating 5 new rows
-        models.TestTrigger.objects.update(
-            int_field=101, dt_field=dt.datetime(2016, 1, 2), field="b"
-        )
+        models.TestTrigger.objects.update(int_field=101, dt_field=_DT_2016, field="b")
         assert models.TestTrigger.objects.count() == 10
-        # Verify the values of the last six rows
-        for row in models.TestTrigger.objects.order_by("id")[6:]:
-            assert row.int_field == 101
-            assert row.field == "b"
-            assert row.dt_field == dt.datetime(2015, 1, 1)
+        # Verify the values of the five logged rows. They carry the old dt_field
+        assert (
+            models.TestTrigger.objects.filter(int_field=101, field="b", dt_field=_DT_2015).count()
+            == 5
+        )
 
         # Updating should not trigger
         models.TestTrigger.objects.update(int_field=1)
         assert models.TestTrigger.objects.count() == 10
 
-        # Do a bulk update with different values
-        test_triggers = list(models.TestTrigger.objects.order_by("id"))
-        # These five should not trigger
-        for val in test_triggers[:5]:
-            val.int_field = 0
-
-        pgbulk.update(models.TestTrigger, test_triggers)
+        # Do a bulk update with different values. Only primary keys are fetched
+        # since int_field is the only column sent in the update
+        ids = models.TestTrigger.objects.order_by("id").values_list("id", flat=True)
+        pgbulk.update(
+            models.TestTrigger,
+            [
+                # The first five should not trigger. The rest keep their value, but
+                # same-value updates still satisfy the condition and trigger
+                models.TestTrigger(id=pk, int_field=0 if i < 5 else 1)
+                for i, pk in enumerate(ids)
+            ],
+            update_fields=["int_field"],
+        )
         assert models.TestTrigger.objects.count() == 15
 
 
@@ -484,210 +505,114 @@ def test_composer_log():
 )
 def test_composer_referencing(operation, expected):
     """Verify Composer trigger referencing."""
-    composer = pgtrigger.Composer(
-        name="composer_referencing",
-        level=pgtrigger.Statement,
-        when=pgtrigger.After,
-        operation=operation,
-    )
+    composer = _composer(name="composer_referencing", operation=operation)
     assert composer.referencing == expected
 
 
+_JOINED_VALUES = 'old_values JOIN new_values ON (old_values."id") = (new_values."id")'
+
+
 @pytest.mark.parametrize(
-    "condition, expected",
+    "condition, joined_values, old_values, new_values",
     [
-        (None, 'old_values JOIN new_values ON (old_values."id") = (new_values."id")'),
+        (None, _JOINED_VALUES, "old_values", "new_values"),
         (
             pgtrigger.Condition("NEW.* IS DISTINCT FROM OLD.*"),
-            'old_values JOIN new_values ON (old_values."id") = (new_values."id") WHERE (new_values.* IS DISTINCT FROM old_values.*)',  # noqa
+            f"{_JOINED_VALUES} WHERE (new_values.* IS DISTINCT FROM old_values.*)",
+            f"{_JOINED_VALUES} WHERE (new_values.* IS DISTINCT FROM old_values.*)",
+            f"{_JOINED_VALUES} WHERE (new_values.* IS DISTINCT FROM old_values.*)",
         ),
         (
             pgtrigger.Q(new__int_field__gt=1, old__int_field__lte=100),
-            'old_values JOIN new_values ON (old_values."id") = (new_values."id") WHERE (new_values."int_field" > 1 AND old_values."int_field" <= 100)',  # noqa
-        ),
-    ],
-)
-def test_composer_get_func_template_kwargs_cond_joined_values(condition, expected):
-    """Verify Composer trigger get_func_template_kwargs for the cond_joined_values property."""
-    assert (
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Update,
-            condition=condition,
-            func=pgtrigger.Func("RETURN NULL;"),
-        )
-        .get_func_template_kwargs(models.TestTrigger)["cond_joined_values"]
-        .strip()
-        == expected
-    )
-
-
-@pytest.mark.parametrize(
-    "condition, expected",
-    [
-        (None, "old_values"),
-        (
-            pgtrigger.Condition("NEW.* IS DISTINCT FROM OLD.*"),
-            'old_values JOIN new_values ON (old_values."id") = (new_values."id") WHERE (new_values.* IS DISTINCT FROM old_values.*)',  # noqa
+            f'{_JOINED_VALUES} WHERE (new_values."int_field" > 1 AND old_values."int_field" <= 100)',  # noqa
+            f'{_JOINED_VALUES} WHERE (new_values."int_field" > 1 AND old_values."int_field" <= 100)',  # noqa
+            f'{_JOINED_VALUES} WHERE (new_values."int_field" > 1 AND old_values."int_field" <= 100)',  # noqa
         ),
         (
             pgtrigger.Q(old__int_field__gt=1),
+            f'{_JOINED_VALUES} WHERE (old_values."int_field" > 1)',
             'old_values WHERE (old_values."int_field" > 1)',
+            f'{_JOINED_VALUES} WHERE (old_values."int_field" > 1)',
+        ),
+        (
+            pgtrigger.Q(new__int_field__gt=1),
+            f'{_JOINED_VALUES} WHERE (new_values."int_field" > 1)',
+            f'{_JOINED_VALUES} WHERE (new_values."int_field" > 1)',
+            'new_values WHERE (new_values."int_field" > 1)',
         ),
         (
             pgtrigger.Q(old__int_field__gt=1) | pgtrigger.Q(new__int_field__lte=100),
-            'old_values JOIN new_values ON (old_values."id") = (new_values."id") WHERE (old_values."int_field" > 1 OR new_values."int_field" <= 100)',  # noqa
+            f'{_JOINED_VALUES} WHERE (old_values."int_field" > 1 OR new_values."int_field" <= 100)',  # noqa
+            f'{_JOINED_VALUES} WHERE (old_values."int_field" > 1 OR new_values."int_field" <= 100)',  # noqa
+            f'{_JOINED_VALUES} WHERE (old_values."int_field" > 1 OR new_values."int_field" <= 100)',  # noqa
         ),
     ],
+    ids=["none", "condition", "new_and_old", "old", "new", "old_or_new"],
 )
-def test_composer_get_func_template_kwargs_cond_old_values(condition, expected):
-    """Verify Composer trigger get_func_template_kwargs for the cond_old_values property."""
-    assert (
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Update,
-            condition=condition,
-            func=pgtrigger.Func("RETURN NULL;"),
-        )
-        .get_func_template_kwargs(models.TestTrigger)["cond_old_values"]
-        .strip()
-        == expected
+def test_composer_get_func_template_kwargs(condition, joined_values, old_values, new_values):
+    """Verify the conditional transition table properties of Composer.get_func_template_kwargs"""
+    kwargs = _composer(condition=condition, func=_RETURN_NULL_FUNC).get_func_template_kwargs(
+        models.TestTrigger
     )
 
+    assert kwargs["cond_joined_values"].strip() == joined_values
+    assert kwargs["cond_old_values"].strip() == old_values
+    assert kwargs["cond_new_values"].strip() == new_values
+
+
+def test_composer_properties():
+    """Verify Composer trigger properties."""
+    with pytest.raises(ValueError, match="referencing"):
+        _composer(referencing=pgtrigger.Referencing(new="new_values"))
+
+
+@pytest.mark.parametrize(
+    "composer",
+    [
+        _composer(func={pgtrigger.Statement: _RETURN_NULL_FUNC}),
+        _composer(level=pgtrigger.Row, func={pgtrigger.Row: _RETURN_NULL_FUNC}),
+    ],
+    ids=["statement", "row"],
+)
+def test_composer_get_func(composer):
+    """Verify Composer triggers select the func for their level."""
+    assert composer.get_func(models.TestTrigger) == _RETURN_NULL_FUNC
+
 
 @pytest.mark.parametrize(
-    "condition, expected",
+    "operation, func, condition, match",
     [
-        (None, "new_values"),
+        (pgtrigger.Insert, "SELECT * FROM old_values.*", None, "references OLD"),
         (
-            pgtrigger.Condition("NEW.* IS DISTINCT FROM OLD.*"),
-            'old_values JOIN new_values ON (old_values."id") = (new_values."id") WHERE (new_values.* IS DISTINCT FROM old_values.*)',  # noqa
+            pgtrigger.Update | pgtrigger.Insert,
+            "SELECT * FROM old_values.*",
+            None,
+            "references OLD",
         ),
         (
-            pgtrigger.Q(new__int_field__gt=1),
-            'new_values WHERE (new_values."int_field" > 1)',
+            pgtrigger.Update | pgtrigger.Insert,
+            pgtrigger.Func("SELECT * FROM {cond_old_values}"),
+            pgtrigger.AnyChange(),
+            "references NEW",
         ),
+        (pgtrigger.Delete, "SELECT * FROM new_values.*", None, "references NEW"),
         (
-            pgtrigger.Q(old__int_field__gt=1),
-            'old_values JOIN new_values ON (old_values."id") = (new_values."id") WHERE (old_values."int_field" > 1)',  # noqa
+            pgtrigger.Update | pgtrigger.Delete,
+            "SELECT * FROM new_values.*",
+            None,
+            "references NEW",
         ),
         (
-            pgtrigger.Q(old__int_field__gt=1) | pgtrigger.Q(new__int_field__lte=100),
-            'old_values JOIN new_values ON (old_values."id") = (new_values."id") WHERE (old_values."int_field" > 1 OR new_values."int_field" <= 100)',  # noqa
+            pgtrigger.Update | pgtrigger.Delete,
+            pgtrigger.Func("SELECT * FROM {cond_new_values}"),
+            pgtrigger.AnyChange(),
+            "references NEW",
         ),
     ],
 )
-def test_composer_get_func_template_kwargs_cond_new_values(condition, expected):
-    """Verify Composer trigger get_func_template_kwargs for the cond_new_values property."""
-    assert (
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Update,
-            condition=condition,
-            func=pgtrigger.Func("RETURN NULL;"),
+def test_composer_render_func_invalid_transition_table(operation, func, condition, match):
+    """Verify we can't render the func if it references a non-existent transition table"""
+    with pytest.raises(ValueError, match=match):
+        _composer(operation=operation, func=func, condition=condition).render_func(
+            models.TestTrigger
         )
-        .get_func_template_kwargs(models.TestTrigger)["cond_new_values"]
-        .strip()
-        == expected
-    )
-
-
-def test_composer_properties():
-    """Verify Composer trigger properties."""
-    with pytest.raises(ValueError, match="referencing"):
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Update,
-            referencing=pgtrigger.Referencing(new="new_values"),
-        )
-
-    func = pgtrigger.Func("RETURN NULL;")
-    assert (
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Update,
-            func={
-                pgtrigger.Statement: func,
-            },
-        ).get_func(models.TestTrigger)
-        == func
-    )
-    assert (
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Row,
-            when=pgtrigger.After,
-            operation=pgtrigger.Update,
-            func={
-                pgtrigger.Row: func,
-            },
-        ).get_func(models.TestTrigger)
-        == func
-    )
-
-    # Verify we can't render the func if it references a non-existent transition table
-    with pytest.raises(ValueError, match="references OLD"):
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Insert,
-            func="SELECT * FROM old_values.*",
-        ).render_func(models.TestTrigger)
-
-    with pytest.raises(ValueError, match="references OLD"):
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Update | pgtrigger.Insert,
-            func="SELECT * FROM old_values.*",
-        ).render_func(models.TestTrigger)
-
-    with pytest.raises(ValueError, match="references NEW"):
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Update | pgtrigger.Insert,
-            func=pgtrigger.Func("SELECT * FROM {cond_old_values}"),
-            condition=pgtrigger.AnyChange(),
-        ).render_func(models.TestTrigger)
-
-    with pytest.raises(ValueError, match="references NEW"):
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Delete,
-            func="SELECT * FROM new_values.*",
-        ).render_func(models.TestTrigger)
-
-    with pytest.raises(ValueError, match="references NEW"):
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Update | pgtrigger.Delete,
-            func="SELECT * FROM new_values.*",
-        ).render_func(models.TestTrigger)
-
-    with pytest.raises(ValueError, match="references NEW"):
-        pgtrigger.Composer(
-            name="composer_values_properties",
-            level=pgtrigger.Statement,
-            when=pgtrigger.After,
-            operation=pgtrigger.Update | pgtrigger.Delete,
-            func=pgtrigger.Func("SELECT * FROM {cond_new_values}"),
-            condition=pgtrigger.AnyChange(),
-        ).render_func(models.TestTrigger)
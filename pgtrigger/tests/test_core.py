@@ -18,9 +18,33 @@ def test_func():
         name="example",
         when=pgtrigger.After,
         operation=pgtrigger.Delete,
-        func=pgtrigger.Func("SELECT {columns.int_field} FROM {meta.db_table}"),
+        func=pgtrigger.Func(
+            "SELECT {columns.int_field} FROM {meta.db_table} WHERE {columns[int_field]} > 0"
+        ),
+    )
+    assert (
+        trigger.render_func(models.TestModel)
+        == "SELECT int_field FROM tests_testmodel WHERE int_field > 0"
     )
-    assert trigger.render_func(models.TestModel) == "SELECT int_field FROM tests_testmodel"
+
+
+def test_func_template_kwargs():
+    """Verify the fields and columns template kwargs behave as dictionaries"""
+    trigger = pgtrigger.Trigger(name="example", when=pgtrigger.After, operation=pgtrigger.Delete)
+    columns = trigger.get_func_template_kwargs(models.TestModel)["columns"]
+
+    assert "int_field" in columns
+    assert dict(**columns) == {
+        "id": "id",
+        "int_field": "int_field",
+        "char_field": "char_field",
+        "float_field": "float_field",
+    }
+    assert columns.get("missing") is None
+
+    # Keys take precedence over dict attributes, and attributes are set as keys
+    columns.items = "items_column"
+    assert columns["items"] == columns.items == "items_column"
 
 
 @pytest.mark.django_db
@@ -7,6 +7,7 @@ import pytest
 from django.contrib.auth.models import User
 from django.core.management import call_command
 from django.db import transaction
+from django.test import override_settings
 
 import pgtrigger
 from pgtrigger import core
@@ -135,3 +136,22 @@ def test_uninstall_install():
 
     for model, trigger in pgtrigger.registered():
         assert trigger.get_installation_status(model, database="default")[0] == core.UNINSTALLED
+
+
+def test_postgres_databases_settings_changed(settings):
+    """Verify cached database aliases are refreshed when DATABASES changes"""
+    assert "default" in pgtrigger.utils.postgres_databases()
+    assert "sqlite" not in pgtrigger.utils.postgres_databases()
+
+    with pytest.warns(UserWarning, match="DATABASES"):
+        with override_settings(DATABASES={"sqlite": settings.DATABASES["sqlite"]}):
+            assert pgtrigger.utils.postgres_databases() == []
+
+    assert "default" in pgtrigger.utils.postgres_databases()
+
+
+@pytest.mark.django_db(databases=["default", "sqlite"])
+def test_exec_sql():
+    """Verify SQL is only executed on postgres databases"""
+    assert pgtrigger.utils.exec_sql("SELECT 1", fetchall=True) == [(1,)]
+    assert pgtrigger.utils.exec_sql("SELECT 1", database="sqlite", fetchall=True) is None
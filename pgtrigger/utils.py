@@ -1,9 +1,21 @@
+import functools
+import re
+from typing import NamedTuple
+
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import DEFAULT_DB_ALIAS, connections
-from django.utils.version import get_version_tuple
+
+_PSYCOPG_VERSION_RE = re.compile(r"^(\d+)\.(\d+)(?:\.(\d+))?")
+
+
+class _PsycopgVersion(NamedTuple):
+    major: int
+    minor: int
+    patch: int
 
 
+@functools.cache
 def _psycopg_version():
     try:
         import psycopg as Database
@@ -12,24 +24,39 @@ def _psycopg_version():
     except Exception as exc:  # pragma: no cover
         raise ImproperlyConfigured("Error loading psycopg2 or psycopg module") from exc
 
-    version_tuple = get_version_tuple(Database.__version__.split(" ", 1)[0])
+    match = _PSYCOPG_VERSION_RE.match(Database.__version__)
+    if not match:  # pragma: no cover
+        raise ImproperlyConfigured(f"Unable to parse psycopg version {Database.__version__}")
 
-    if version_tuple[0] not in (2, 3):  # pragma: no cover
-        raise ImproperlyConfigured(f"Pysocpg version {version_tuple[0]} not supported")
+    major, minor, patch = match.groups()
+    version = _PsycopgVersion(int(major), int(minor), int(patch or 0))
 
-    return version_tuple
+    if version.major not in (2, 3):  # pragma: no cover
+        raise ImproperlyConfigured(f"Pysocpg version {version.major} not supported")
+
+    return version
 
 
 psycopg_version = _psycopg_version()
-psycopg_maj_version = psycopg_version[0]
+psycopg_maj_version = psycopg_version.major
 
 
 class AttrDict(dict):
-    """A dictionary where keys can be accessed as attributes"""
+    """A dictionary where keys can be accessed as attributes.
+
+    Keys take precedence over dict attributes. Attributes are resolved on access
+    instead of aliasing ``__dict__`` to the dictionary, which would make every
+    instance a reference cycle.
+    """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.__dict__ = self
+    def __getattribute__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            return super().__getattribute__(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
 
 
 def connection(database=None):
@@ -43,41 +70,77 @@ def connection(database=None):
 
 def pg_maj_version(cursor):
     """Return the major version of Postgres that's running"""
-    version = getattr(cursor.connection, "server_version", cursor.connection.info.server_version)
-    return int(str(version)[:-4])
+    if psycopg_maj_version == 2:
+        version = cursor.connection.server_version
+    else:
+        version = cursor.connection.info.server_version
 
+    return version // 10000
 
+
+@functools.lru_cache(maxsize=None)
 def is_postgres(database):
+    """Return True if the database uses a Postgres backend.
+
+    The vendor of an alias does not change for the life of the process, so results are
+    cached. Use `is_postgres.cache_clear()` if database settings are swapped.
+    """
     return connection(database).vendor == "postgresql"
 
 
+@functools.lru_cache(maxsize=None)
+def _database_aliases():
+    return tuple(settings.DATABASES)
+
+
+def clear_database_caches(setting, **kwargs):
+    """Clear cached database information when the DATABASES setting changes"""
+    if setting == "DATABASES":
+        _database_aliases.cache_clear()
+        is_postgres.cache_clear()
+
+
 def postgres_databases(databases=None):
     """Return postgres databases from the provided list of databases.
 
     If no databases are provided, return all postgres databases
     """
-    databases = databases or list(settings.DATABASES)
-    assert isinstance(databases, list)
+    if not databases:
+        databases = _database_aliases()
+    else:
+        assert isinstance(databases, list)
+
     return [database for database in databases if is_postgres(database)]
 
 
-def exec_sql(sql, database=None, fetchall=False):
-    if is_postgres(database):  # pragma: no branch
-        with connection(database).cursor() as cursor:
-            cursor.execute(sql)
+def exec_postgres_sql(sql, database=None, fetchall=False):
+    """Execute SQL on a database the caller has already verified is Postgres"""
+    with connection(database).cursor() as cursor:
+        cursor.execute(sql)
+
+        if fetchall:
+            return cursor.fetchall()
 
-            if fetchall:
-                return cursor.fetchall()
+
+def exec_sql(sql, database=None, fetchall=False):
+    if is_postgres(database):
+        return exec_postgres_sql(sql, database=database, fetchall=fetchall)
 
 
 def quote(label, char='"'):
     """Conditionally wraps a label in quotes"""
-    if label.startswith(char) or label.endswith(char):
-        return label
-    else:
-        return f"{char}{label}{char}"
+    return label if label[:1] == char or label[-1:] == char else f"{char}{label}{char}"
+
+
+_UNINSTALL_SQL = "DROP TRIGGER IF EXISTS {trigger_pgid} ON {table};"
+
+
+@functools.lru_cache(maxsize=512)
+def _quote_table(table):
+    """Quotes a table name. Cached since many triggers are often dropped from one table"""
+    return quote(table)
 
 
 def render_uninstall(table, trigger_pgid):
     """Renders uninstallation SQL"""
-    return f"DROP TRIGGER IF EXISTS {trigger_pgid} ON {quote(table)};"
+    return _UNINSTALL_SQL.format(trigger_pgid=trigger_pgid, table=_quote_table(table))